@@ -20,9 +20,9 @@ def analyzer(mock_context):
     """Create PlanAnalyzer instance."""
     return PlanAnalyzer(mock_context)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_plan_json():
-    """Create sample Terraform plan JSON."""
+    """Create sample Terraform plan JSON (shared read-only by the module)."""
     return {
         "resource_changes": [
             {
@@ -84,12 +84,57 @@ class TestPlanAnalyzer:
                 "delete": 1
             }
 
+    def test_analyze_change_breakdown_replace(self, analyzer):
+        """Test replacements count as a create and a delete."""
+        plan_json = {
+            "resource_changes": [
+                {
+                    "address": f"aws_instance.server{i}",
+                    "type": "aws_instance",
+                    "change": {"actions": ["delete", "create"]}
+                }
+                for i in range(2)
+            ] + [
+                {
+                    "address": "aws_instance.web",
+                    "type": "aws_instance",
+                    "change": {"actions": ["create"]}
+                }
+            ]
+        }
+        
+        with patch("builtins.open", mock_open(read_data=json.dumps(plan_json))):
+            result = analyzer.analyze(Mock(), plan_path="test.tfplan")
+        
+        assert result.data["total_changes"] == 3
+        assert result.data["change_breakdown"] == {
+            "create": 3,
+            "update": 0,
+            "delete": 2
+        }
+
     def test_analyze_invalid_json(self, analyzer):
         """Test analysis with invalid JSON plan."""
         with patch("builtins.open", mock_open(read_data="invalid json")):
             with pytest.raises(ValueError, match="Invalid plan file format"):
                 analyzer.analyze(Mock(), plan_path="test.tfplan")
 
+    def test_analyze_invalid_json_stdlib_fallback(self, analyzer):
+        """Test invalid JSON is reported the same way without orjson."""
+        with patch("tfsumpy.plan.analyzer.orjson", None), \
+                patch("builtins.open", mock_open(read_data="invalid json")):
+            with pytest.raises(ValueError, match="Invalid plan file format"):
+                analyzer.analyze(Mock(), plan_path="test.tfplan")
+
+    def test_parse_plan_stdlib_fallback(self, analyzer, sample_plan_json):
+        """Test plan parsing gives the same result without orjson."""
+        plan_content = json.dumps(sample_plan_json)
+        default_changes = analyzer._parse_plan(plan_content)
+        with patch("tfsumpy.plan.analyzer.orjson", None):
+            fallback_changes = analyzer._parse_plan(plan_content)
+        
+        assert fallback_changes == default_changes
+
     def test_parse_plan(self, analyzer, sample_plan_json):
         """Test plan parsing functionality."""
         changes = analyzer._parse_plan(json.dumps(sample_plan_json))
@@ -98,20 +143,17 @@ class TestPlanAnalyzer:
         assert all(isinstance(change, ResourceChange) for change in changes)
         
         # Verify specific changes
-        create_change = next(c for c in changes if c.action == "create")
-        assert create_change.resource_type == "aws_s3_bucket"
-        
-        update_change = next(c for c in changes if c.action == "update")
-        assert update_change.module == "storage"
-        
-        delete_change = next(c for c in changes if c.action == "delete")
-        assert delete_change.identifier == "aws_instance.server"
+        by_action = {c.action: c for c in changes}
+        assert by_action["create"].resource_type == "aws_s3_bucket"
+        assert by_action["update"].module == "storage"
+        assert by_action["delete"].identifier == "aws_instance.server"
 
     def test_extract_module_name(self, analyzer):
         """Test module name extraction."""
         assert analyzer._extract_module_name("module.storage.aws_s3_bucket.logs") == "storage"
         assert analyzer._extract_module_name("module.a.module.b.resource") == "a.b"
         assert analyzer._extract_module_name("aws_s3_bucket.data") == "root"
+        assert analyzer._extract_module_name("aws_s3_bucket.my_module.data") == "root"
 
     def test_sanitize_text(self, analyzer):
         """Test text sanitization."""
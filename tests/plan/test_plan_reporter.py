@@ -1,7 +1,10 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
+from tfsumpy.plan import reporter as reporter_module
 from tfsumpy.plan.reporter import PlanReporter
+import os
 import re
+import tempfile
 import json
 
 @pytest.fixture
@@ -109,6 +112,17 @@ class TestPlanReporter:
             assert any("t2.micro -> t2.small" in call[0][0] 
                       for call in mock_write.call_args_list)
 
+    def test_print_report_single_write(self, reporter, sample_report_data):
+        """Test console report is flushed to the output in one write."""
+        reporter.output = Mock()
+        reporter.print_report(sample_report_data, show_details=True, show_changes=True)
+        
+        assert reporter.output.write.call_count == 1
+        written_text = strip_ansi(reporter.output.write.call_args[0][0])
+        assert 'Total Changes: 3' in written_text
+        assert 'UPDATE aws_instance: web_server' in written_text
+        assert 't2.micro -> t2.small' in written_text
+
     def test_print_report_markdown(self, reporter, sample_report_data):
         """Test markdown report generation."""
         with patch.object(reporter, '_write') as mock_write:
@@ -126,6 +140,44 @@ class TestPlanReporter:
             assert '**Resources to Change**: 1' in written_text
             assert '**Resources to Destroy**: 1' in written_text
 
+    def test_print_report_markdown_custom_env(self, reporter, sample_report_data):
+        """Test markdown renders through an assigned environment."""
+        from jinja2 import DictLoader, Environment
+        reporter.env = Environment(loader=DictLoader(
+            {'plan_report.md': 'Total: {{ total_resources }}'}
+        ))
+        with patch.object(reporter, '_write') as mock_write:
+            reporter.print_report_markdown(sample_report_data)
+        assert mock_write.call_args[0][0] == 'Total: 3'
+
+    def test_env_not_shared_between_reporters(self):
+        """Test a filter added through one reporter does not reach another."""
+        first, second = PlanReporter(), PlanReporter()
+        first.env.filters['shout'] = str.upper
+
+        assert 'shout' in first.env.filters
+        assert 'shout' not in second.env.filters
+
+    @pytest.mark.skipif(not hasattr(os, 'getuid'), reason="POSIX cache directory layout")
+    @pytest.mark.parametrize('dev_mode', ['0', '1'])
+    def test_print_report_markdown_unusable_bytecode_cache(self, reporter, sample_report_data,
+                                                           tmp_path, monkeypatch, dev_mode):
+        """Test markdown still renders when the bytecode cache directory is unusable."""
+        # A file where Jinja2 expects its private cache directory
+        (tmp_path / f"_jinja2-cache-{os.getuid()}").write_text("")
+        monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+        monkeypatch.setenv('TFSUMPY_DEV', dev_mode)
+        reporter_module._bytecode_cache.cache_clear()
+        try:
+            with patch.object(reporter, '_write') as mock_write:
+                reporter.print_report_markdown(sample_report_data)
+            assert reporter.env.bytecode_cache is None
+            assert reporter.env.auto_reload is (dev_mode == '1')
+        finally:
+            reporter_module._bytecode_cache.cache_clear()
+
+        assert '**Total Resources**: 3' in mock_write.call_args[0][0]
+
     def test_print_report_markdown_with_details(self, reporter, sample_report_data):
         """Test markdown report with detailed information."""
         with patch.object(reporter, '_write') as mock_write:
@@ -200,6 +252,74 @@ class TestPlanReporter:
                         assert 'before' in change
                         assert 'after' in change
 
+    def test_print_report_json_stdlib_fallback(self, reporter, sample_report_data):
+        """Test JSON output is identical without orjson installed."""
+        with patch.object(reporter, '_write') as mock_write:
+            reporter.print_report_json(sample_report_data, show_changes=True)
+            default_output = json.loads(mock_write.call_args[0][0])
+        with patch('tfsumpy.plan.reporter.orjson', None), \
+                patch.object(reporter, '_write') as mock_write:
+            reporter.print_report_json(sample_report_data, show_changes=True)
+            fallback_output = json.loads(mock_write.call_args[0][0])
+
+        assert fallback_output['summary'] == default_output['summary']
+        assert fallback_output['resources'] == default_output['resources']
+
+    def test_print_report_json_compact(self, reporter, sample_report_data):
+        """Test compact JSON output has no indentation."""
+        with patch.object(reporter, '_write') as mock_write:
+            reporter.print_report_json(sample_report_data, compact=True)
+            written_text = mock_write.call_args[0][0]
+
+        assert '\n' not in written_text
+        assert ', ' not in written_text
+        assert json.loads(written_text)['summary']['total_resources'] == 3
+
+    def test_print_report_json_non_serializable_analysis(self, reporter, sample_report_data):
+        """Test values without a JSON representation are written as strings."""
+        import math
+        from datetime import datetime
+        from enum import Enum
+        from collections import OrderedDict
+
+        class Level(Enum):
+            HIGH = 'high'
+
+        data = dict(sample_report_data, analysis={
+            'checked_on': datetime(2024, 1, 2, 3, 4, 5),
+            'level': Level.HIGH,
+            'owners': OrderedDict(team='José'),
+            'large': 1e16,
+            'small': 1e-7,
+            'missing': float('nan'),
+        })
+        for orjson_module in (None, reporter_module.orjson):
+            with patch.object(reporter_module, 'orjson', orjson_module), \
+                    patch.object(reporter, '_write') as mock_write:
+                reporter.print_report_json(data)
+                written_text = mock_write.call_args[0][0]
+            analysis = json.loads(written_text)['analysis']
+            missing = analysis.pop('missing')
+            assert analysis == {
+                'checked_on': '2024-01-02 03:04:05',
+                'level': 'high',
+                'owners': {'team': 'José'},
+                'large': 1e16,
+                'small': 1e-7,
+            }
+            # Non-ASCII text is written raw by both encoders
+            assert '"team": "José"' in written_text
+
+            # Float formatting and non-finite floats follow the encoder
+            if orjson_module is None:
+                assert '"large": 1e+16' in written_text
+                assert '"small": 1e-07' in written_text
+                assert math.isnan(missing)
+            else:
+                assert '"large": 1e16' in written_text
+                assert '"small": 1e-7' in written_text
+                assert missing is None
+
     def test_invalid_report_format(self, reporter):
         """Test handling of invalid report format."""
         with pytest.raises(ValueError, match="Invalid report format"):
@@ -228,6 +348,17 @@ class TestPlanReporter:
             plain_text = strip_ansi(written_text)
             assert "~ name = old -> new" in plain_text
 
+    def test_attribute_changes_identical(self, reporter):
+        """Test resources with identical before/after write nothing."""
+        resource = {
+            "action": "update",
+            "before": {"name": "same"},
+            "after": {"name": "same"},
+        }
+        with patch.object(reporter, '_write') as mock_write:
+            reporter._print_attribute_changes(resource)
+            mock_write.assert_not_called()
+
     def test_color_output(self, reporter, sample_report_data):
         """Test color formatting in output."""
         with patch.object(reporter, '_write') as mock_write:
@@ -0,0 +1,70 @@
+import importlib.util
+import os
+from unittest.mock import Mock, patch
+import pytest
+from tfsumpy import plugins
+from tfsumpy.plugins import load_plugins
+
+PLUGIN_SOURCE = """
+def register(context):
+    context.registered.append({version!r})
+"""
+
+def write_plugin(path, version):
+    path.write_text(PLUGIN_SOURCE.format(version=version))
+
+@pytest.fixture
+def spec_spy(monkeypatch):
+    """Empty the plugin cache and count plugin module executions."""
+    monkeypatch.setattr(plugins, "_PLUGIN_CACHE", {})
+    with patch.object(importlib.util, "spec_from_file_location",
+                      wraps=importlib.util.spec_from_file_location) as spy:
+        yield spy
+
+def test_load_plugins_missing_dir(tmp_path):
+    """Test loading from a directory that does not exist is a no-op."""
+    context = Mock()
+    load_plugins(context, plugin_dir=str(tmp_path / "missing"))
+    context.assert_not_called()
+
+def test_load_plugins_reuses_cached_module(tmp_path, spec_spy):
+    """Test plugins are executed once and registered on every call."""
+    write_plugin(tmp_path / "cost.py", 1)
+    (tmp_path / "notes.txt").write_text("not a plugin")
+    context = Mock(registered=[])
+
+    load_plugins(context, plugin_dir=str(tmp_path))
+    load_plugins(context, plugin_dir=str(tmp_path))
+
+    assert spec_spy.call_count == 1
+    assert context.registered == [1, 1]
+
+def test_load_plugins_reloads_modified_file(tmp_path, spec_spy):
+    """Test a plugin is executed again after its file changes."""
+    plugin_path = tmp_path / "cost.py"
+    write_plugin(plugin_path, 1)
+    context = Mock(registered=[])
+    load_plugins(context, plugin_dir=str(tmp_path))
+
+    write_plugin(plugin_path, 2)
+    stat = plugin_path.stat()
+    os.utime(plugin_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    load_plugins(context, plugin_dir=str(tmp_path))
+
+    assert spec_spy.call_count == 2
+    assert context.registered == [1, 2]
+
+def test_load_plugins_reloads_same_mtime_edit(tmp_path, spec_spy):
+    """Test an edit that keeps the mtime (coarse timestamps) is still picked up."""
+    plugin_path = tmp_path / "cost.py"
+    write_plugin(plugin_path, 1)
+    mtime_ns = plugin_path.stat().st_mtime_ns
+    context = Mock(registered=[])
+    load_plugins(context, plugin_dir=str(tmp_path))
+
+    write_plugin(plugin_path, "edited")
+    os.utime(plugin_path, ns=(mtime_ns, mtime_ns))
+    load_plugins(context, plugin_dir=str(tmp_path))
+
+    assert spec_spy.call_count == 2
+    assert context.registered == [1, "edited"]
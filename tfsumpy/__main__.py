@@ -6,10 +6,16 @@ from .plan.reporter import PlanReporter
 from .context import Context
 from tfsumpy.plugins import load_plugins
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def configure_logging(debug: bool = False) -> None:
+    """Configure root logging once for the command line entry point.
+    
+    Args:
+        debug: Enable debug level logging
+    """
+    logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
+
 def main():
     parser = argparse.ArgumentParser(description='Analyze Terraform plan files')
     parser.add_argument('plan_path', help='Path to the Terraform plan file')
@@ -30,6 +36,9 @@ def main():
     output_group.add_argument('--hide-changes',
                             action='store_true',
                             help='Hide detailed attribute changes')
+    output_group.add_argument('--compact',
+                            action='store_true',
+                            help='Emit minified JSON (only with --output json)')
     
     # Deprecated arguments (kept for backward compatibility)
     deprecated_group = parser.add_argument_group('Deprecated Options')
@@ -47,6 +56,7 @@ def main():
     parser.add_argument('--plugin-dir', default='plugins', help='Directory to load plugins from')
     
     args = parser.parse_args()
+    configure_logging(debug=args.debug)
     
     # Handle deprecated arguments
     if args.changes:
@@ -60,9 +70,7 @@ def main():
                      DeprecationWarning, stacklevel=2)
     
     try:
-        # Set debug logging if requested
         if args.debug:
-            logging.getLogger().setLevel(logging.DEBUG)
             logger.debug("Debug logging enabled")
         
         # Initialize Context and register analyzers
@@ -92,7 +100,8 @@ def main():
         elif output_format == 'json':
             plan_reporter.print_report_json(plan_results[0].data,
                                           show_changes=not args.hide_changes,
-                                          show_details=args.detailed or args.details)
+                                          show_details=args.detailed or args.details,
+                                          compact=args.compact)
         else:  # default output
             context.run_reports("plan", plan_results[0].data,
                               show_changes=not args.hide_changes,
@@ -1,7 +1,8 @@
 import json
 import logging
 import os
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, List, Any, Optional, Pattern
 from .analyzer import AnalyzerInterface, AnalyzerResult
 from .reporter import ReporterInterface
 
@@ -12,16 +13,14 @@ class Context:
         self.config_path = config_path
         self.debug = debug
         
-        # Configure logging
+        # Logging handlers are configured by the application (see
+        # tfsumpy.__main__.configure_logging), not per Context
         self.logger = logging.getLogger(__name__)
-        log_level = logging.DEBUG if debug else logging.INFO
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        if debug:
+            self.logger.setLevel(logging.DEBUG)
         
         # Initialize components
-        self.sensitive_patterns: List[tuple[str, str]] = []
+        self.sensitive_patterns: List[tuple[Pattern[str], str]] = []
         self.config: Dict[str, Any] = {}
         
         # Initialize analyzer registry
@@ -141,10 +140,15 @@ class Context:
 
     def _process_config(self) -> None:
         """Process loaded configuration into usable formats"""
-        self.sensitive_patterns = [
-            (rule['pattern'], rule['replacement']) 
-            for rule in self.config['sensitive_patterns']
-        ]
+        # Compile once so sanitization goes straight to Pattern.sub
+        try:
+            self.sensitive_patterns = [
+                (re.compile(rule['pattern']), rule['replacement'])
+                for rule in self.config['sensitive_patterns']
+            ]
+        except re.error as e:
+            self.logger.error(f"Invalid sensitive pattern in config: {str(e)}")
+            raise
         
         self.logger.debug(f"Loaded {len(self.sensitive_patterns)} sensitive patterns")
 
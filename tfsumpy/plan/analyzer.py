@@ -2,13 +2,25 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import List, TYPE_CHECKING
+import re
+from collections import Counter
+from types import ModuleType
+from typing import List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..context import Context
 from ..resource import ResourceChange
 from ..analyzer import AnalyzerInterface, AnalyzerResult
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib parser
+    orjson = None
+
+# Module names in a resource address: each 'module' segment and the one after it
+_MODULE_RE = re.compile(r'(?:^|\.)module\.([^.]+)')
+
 class PlanAnalyzer(AnalyzerInterface):
     """Analyzes Terraform plan files and generates structured reports."""
     
@@ -44,7 +56,8 @@ class PlanAnalyzer(AnalyzerInterface):
         
         try:
             # Read and parse plan file
-            with open(plan_path, 'r') as f:
+            # Read raw bytes; both parsers decode UTF-8 themselves
+            with open(plan_path, 'rb') as f:
                 self.logger.debug("Reading plan file")
                 plan_content = f.read()
             
@@ -53,16 +66,15 @@ class PlanAnalyzer(AnalyzerInterface):
             changes = self._parse_plan(plan_content)
             
             # Generate summary statistics
-            change_counts = {'create': 0, 'update': 0, 'delete': 0}
-            for change in changes:
-                # For reporting, treat 'replace' as both a delete and a create
-                if change.action == 'replace':
-                    change_counts['delete'] += 1
-                    change_counts['create'] += 1
-                elif change.action in change_counts:
-                    change_counts[change.action] += 1
-                else:
-                    change_counts[change.action] = 1  # fallback for unexpected actions
+            tally = Counter(change.action for change in changes)
+            # For reporting, treat 'replace' as both a delete and a create
+            replaced = tally.pop('replace', 0)
+            change_counts = {
+                'create': tally.pop('create', 0) + replaced,
+                'update': tally.pop('update', 0),
+                'delete': tally.pop('delete', 0) + replaced,
+            }
+            change_counts.update(tally)  # unexpected actions keep their own count
             
             self.logger.info(f"Found {len(changes)} resource changes")
             self.logger.debug(f"Change breakdown: {change_counts}")
@@ -85,29 +97,37 @@ class PlanAnalyzer(AnalyzerInterface):
             self.logger.error(f"Error analyzing plan: {str(e)}")
             raise
 
-    def _parse_plan(self, plan_content: str) -> List[ResourceChange]:
+    def _parse_plan(self, plan_content: Union[str, bytes]) -> List[ResourceChange]:
         """Parse Terraform plan JSON into structured format.
         
         Args:
-            plan_content: Raw plan JSON content
+            plan_content: Raw plan JSON content, as text or UTF-8 bytes
             
         Returns:
             List of ResourceChange objects
         """
         self.logger.debug("Parsing plan JSON")
-        plan = json.loads(plan_content)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+        # handle both parsers the same way
+        if orjson is not None:
+            plan = orjson.loads(plan_content)
+        else:
+            plan = json.loads(plan_content)
         changes = []
         
         # Get resource changes from plan
         resource_changes = plan.get('resource_changes', [])
         self.logger.debug(f"Found {len(resource_changes)} resource changes in plan")
+        # Checked once so the per-change message is not formatted at INFO level
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         
         for change in resource_changes:
             # Extract change action
             actions = change.get('change', {}).get('actions', ['no-op'])
             action = actions[0] if actions else 'no-op'
             if action != 'no-op':
-                self.logger.debug(f"Processing {actions} change for {change.get('address', '')}")
+                if debug_enabled:
+                    self.logger.debug(f"Processing {actions} change for {change.get('address', '')}")
                 
                 # Extract module information
                 address = change.get('address', '')
@@ -146,12 +166,9 @@ class PlanAnalyzer(AnalyzerInterface):
             Module name or 'root' if not in a module
         """
         if 'module.' in address:
-            module_parts = address.split('.')
-            module_path = []
-            for i, part in enumerate(module_parts):
-                if part == 'module' and i + 1 < len(module_parts):
-                    module_path.append(module_parts[i + 1])
-            return '.'.join(module_path)
+            module_path = _MODULE_RE.findall(address)
+            if module_path:
+                return '.'.join(module_path)
         return 'root'
 
     def _sanitize_text(self, text: str) -> str:
@@ -1,11 +1,169 @@
+from __future__ import annotations
+
 import logging
-from typing import Dict, Any, List
+import os
+from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType, ModuleType
+from typing import Dict, Any, Iterator, List, Optional, TYPE_CHECKING
 from ..reporters.base_reporter import BaseReporter
 from ..reporter import ReporterInterface
 import json as _json
-from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
-from datetime import datetime
+
+# Jinja2, pathlib and datetime are imported lazily so the default console
+# report does not pay for them at startup.
+if TYPE_CHECKING:
+    from jinja2 import BytecodeCache, Environment
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+# Internal attributes never shown in attribute diffs
+_SKIP_ATTRS = frozenset({'id', 'tags_all'})
+
+# Diff symbols per action, colorized once at import time
+_SYMBOL_COLORS = MappingProxyType({
+    '+': 'green',   # create
+    '~': 'blue',    # update
+    '-': 'red',     # delete
+    '-/+': 'yellow' # replace
+})
+_COLORED_SYMBOLS = MappingProxyType({
+    symbol: f"{BaseReporter.COLORS[color]}{symbol}{BaseReporter.COLORS['reset']}"
+    for symbol, color in _SYMBOL_COLORS.items()
+})
+
+# Action headers for the console report, colorized once at import time
+_ACTION_UPPER = MappingProxyType({
+    'create': 'CREATE',
+    'update': 'UPDATE',
+    'delete': 'DELETE',
+    'replace': 'REPLACE',
+})
+_ACTION_COLORS = MappingProxyType({
+    'create': 'green',
+    'update': 'blue',
+    'delete': 'red',
+    'replace': 'yellow',
+})
+_COLORED_ACTIONS = MappingProxyType({
+    action: f"{BaseReporter.COLORS[_ACTION_COLORS[action]]}{label}{BaseReporter.COLORS['reset']}"
+    for action, label in _ACTION_UPPER.items()
+})
+
+# orjson hands these to _json_default instead of encoding them itself, so
+# they are written the same way as by the stdlib encoder
+_ORJSON_PASSTHROUGH = 0
+if orjson is not None:
+    _ORJSON_PASSTHROUGH = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+def _json_default(obj: Any) -> Any:
+    """Encode a value neither JSON encoder handles natively.
+    
+    Enums are written as their value (orjson does this natively), subclasses
+    of builtin types as the builtin (as the stdlib encoder does) and anything
+    else as its str().
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, str):
+        return str.__str__(obj)
+    if isinstance(obj, int):
+        return int.__int__(obj)
+    if isinstance(obj, float):
+        return float.__float__(obj)
+    if isinstance(obj, dict):
+        return dict(obj)
+    if isinstance(obj, (list, tuple)):
+        return list(obj)
+    return str(obj)
+
+def _dumps_json(obj: Any, compact: bool = False) -> str:
+    """Serialize an object as JSON, using orjson when installed.
+    
+    Both encoders write non-ASCII text as raw UTF-8 and pass values that are
+    not JSON serializable through _json_default. Float formatting still
+    follows the encoder: orjson writes 1e16 and 1e-7 where the stdlib writes
+    1e+16 and 1e-07, and non-finite floats become null instead of NaN.
+    
+    Args:
+        obj: Object to serialize
+        compact: Emit minified JSON instead of 2-space indented output
+    """
+    if orjson is not None:
+        try:
+            option = _ORJSON_PASSTHROUGH if compact else _ORJSON_PASSTHROUGH | orjson.OPT_INDENT_2
+            return orjson.dumps(obj, option=option, default=_json_default).decode('utf-8')
+        except TypeError:
+            # Values orjson rejects (e.g. non-string keys) go through stdlib
+            pass
+    if compact:
+        return _json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_json_default)
+    return _json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+
+def _diff_attributes(before: Dict, after: Dict) -> List[Dict]:
+    """Return the attributes that differ between two blocks, sorted by name.
+    
+    Args:
+        before: Attribute values before the change
+        after: Attribute values after the change
+        
+    Returns:
+        List[Dict]: One entry per changed attribute with its before/after values
+    """
+    # Identical blocks have nothing to diff
+    if before == after:
+        return []
+    all_attrs = (before.keys() | after.keys()) - _SKIP_ATTRS
+    changed_attrs = [
+        attr for attr in all_attrs
+        if before.get(attr) != after.get(attr)
+    ]
+    return [
+        {'attribute': attr, 'before': before.get(attr), 'after': after.get(attr)}
+        for attr in sorted(changed_attrs)
+    ]
+
+@lru_cache(maxsize=None)
+def _bytecode_cache() -> Optional[BytecodeCache]:
+    """Return the on-disk template bytecode cache, or None if it is unusable.
+    
+    The cache only saves compile time, so a temp directory that is read-only
+    or holds a foreign ``_jinja2-cache-<uid>`` entry disables it instead of
+    failing the report.
+    """
+    from jinja2 import FileSystemBytecodeCache
+
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        logging.getLogger(__name__).debug(f"Template bytecode cache disabled: {e}")
+        return None
+
+def _build_env() -> Environment:
+    """Create a Jinja2 environment for the report templates."""
+    from pathlib import Path
+    from jinja2 import Environment, FileSystemLoader
+
+    template_dir = Path(__file__).parent.parent / 'templates'
+    return Environment(
+        autoescape=True,
+        loader=FileSystemLoader(str(template_dir)),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # Set TFSUMPY_DEV=1 to pick up template edits without restarting
+        auto_reload=os.environ.get('TFSUMPY_DEV') == '1',
+        cache_size=50,
+        # Reuse compiled template bytecode across reporters and CLI runs
+        bytecode_cache=_bytecode_cache()
+    )
 
 class PlanReporter(BaseReporter, ReporterInterface):
     """Handles formatting and display of Terraform plan results."""
@@ -14,19 +172,23 @@ class PlanReporter(BaseReporter, ReporterInterface):
         """Initialize the plan reporter."""
         super().__init__()
         self.logger = logging.getLogger(__name__)
-        # Initialize Jinja2 environment
-        template_dir = Path(__file__).parent.parent / 'templates'
-        self.env = Environment(
-            autoescape=True,
-            loader=FileSystemLoader(str(template_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        self._env: Optional[Environment] = None
 
     @property
     def category(self) -> str:
         return "plan"
 
+    @property
+    def env(self) -> Environment:
+        """Jinja2 environment for the report templates, created on first use."""
+        if self._env is None:
+            self._env = _build_env()
+        return self._env
+
+    @env.setter
+    def env(self, env: Environment) -> None:
+        self._env = env
+
     def get_report(self, data: Any, **kwargs) -> Dict:
         """Return the plan report object.
         
@@ -49,19 +211,22 @@ class PlanReporter(BaseReporter, ReporterInterface):
             self.logger.error(f"Error processing report: {str(e)}")
             raise
 
-    def _process_resources(self, resources: List[Dict], show_changes: bool = False, show_details: bool = False) -> List[Dict]:
+    def _process_resources(self, resources: List[Dict], show_changes: bool = False, show_details: bool = False) -> Iterator[Dict]:
         """Process resources and their changes.
         
+        Resources are yielded one at a time so callers that only iterate
+        once (such as the markdown template) never hold the full list.
+        
         Args:
             resources: List of resources to process
             show_changes: Whether to include attribute changes
             show_details: Whether to include additional details
             
-        Returns:
-            List[Dict]: Processed resources with changes and details
+        Yields:
+            Dict: Processed resource with changes and details
         """
-        processed_resources = []
         for resource in resources:
+            replacement_triggers = resource.get('replacement_triggers', [])
             resource_data = {
                 'resource_type': resource['resource_type'],
                 'identifier': resource['identifier'],
@@ -70,30 +235,14 @@ class PlanReporter(BaseReporter, ReporterInterface):
                 'module': resource.get('module', 'root'),
                 # Add replacement and triggers for reporting
                 'replacement': resource.get('replacement', False),
-                'replacement_triggers': resource.get('replacement_triggers', []),
+                'replacement_triggers': replacement_triggers,
             }
+            raw_before = resource.get('before', {})
+            raw_after = resource.get('after', {})
 
             # Process changes if requested
             if show_changes:
-                before = resource.get('before', {}) or {}
-                after = resource.get('after', {}) or {}
-                changes = []
-                
-                # Get all changed attributes
-                all_attrs = set(before.keys()) | set(after.keys())
-                skip_attrs = {'id', 'tags_all'}  # Skip internal attributes
-                
-                for attr in sorted(all_attrs - skip_attrs):
-                    before_val = before.get(attr)
-                    after_val = after.get(attr)
-                    
-                    if before_val != after_val:
-                        changes.append({
-                            'attribute': attr,
-                            'before': before_val,
-                            'after': after_val
-                        })
-                
+                changes = _diff_attributes(raw_before or {}, raw_after or {})
                 if changes:
                     resource_data['changes'] = changes
 
@@ -103,16 +252,14 @@ class PlanReporter(BaseReporter, ReporterInterface):
                     'dependencies': resource.get('dependencies', []),
                     'tags': resource.get('tags', {}),
                     'raw': {
-                        'before': resource.get('before', {}),
-                        'after': resource.get('after', {})
+                        'before': raw_before,
+                        'after': raw_after
                     },
                     # Add replacement triggers to details if present
-                    'replacement_triggers': resource.get('replacement_triggers', [])
+                    'replacement_triggers': replacement_triggers
                 }
 
-            processed_resources.append(resource_data)
-        
-        return processed_resources
+            yield resource_data
 
     def print_report(self, data: Any, **kwargs) -> None:
         """Print the plan analysis report.
@@ -124,17 +271,18 @@ class PlanReporter(BaseReporter, ReporterInterface):
         Raises:
             ValueError: If report format is invalid
         """
-        report = self.get_report(data, **kwargs)
+        report = self.get_report(data)
         show_details = kwargs.get('show_details', False)
         show_changes = kwargs.get('show_changes', False)
 
-        self._print_header("Terraform Plan Analysis")
-        self._print_summary(report)
-        
-        if show_details or show_changes:
-            if 'resources' not in report:
-                raise ValueError("Report missing resource details")
-            self._print_resource_details(report['resources'], show_changes)
+        with self._buffered():
+            self._print_header("Terraform Plan Analysis")
+            self._print_summary(report)
+            
+            if show_details or show_changes:
+                if 'resources' not in report:
+                    raise ValueError("Report missing resource details")
+                self._print_resource_details(report['resources'], show_changes)
 
     def _print_header(self, title: str) -> None:
         """Print a formatted header."""
@@ -146,26 +294,23 @@ class PlanReporter(BaseReporter, ReporterInterface):
         self._write(f"\n{self._colorize('Total Changes: ' + str(report['total_changes']), 'bold')}\n")
         
         # Add change counts by type (do not show 'replace' in summary)
-        for action in ['create', 'update', 'delete']:
-            count = report['change_breakdown'].get(action, 0)
-            self._write(f"{action.title()}: {count}\n")
+        breakdown = report['change_breakdown']
+        self._write(
+            f"Create: {breakdown.get('create', 0)}\n"
+            f"Update: {breakdown.get('update', 0)}\n"
+            f"Delete: {breakdown.get('delete', 0)}\n"
+        )
 
     def _print_resource_details(self, resources: list, show_changes: bool = False) -> None:
         """Format the resource details section."""
         self._write(f"\n{self._colorize('Resources Changes:', 'bold')}\n")
         
-        # Define color mapping for actions
-        action_colors = {
-            'CREATE': 'green',
-            'UPDATE': 'blue',
-            'DELETE': 'red',
-            'REPLACE': 'yellow',
-        }
-        
         for resource in resources:
-            action_str = resource['action'].upper()
+            action = resource['action']
             # Color the action string based on the action type
-            colored_action = self._colorize(action_str, action_colors.get(action_str, 'bold'))
+            colored_action = _COLORED_ACTIONS.get(action)
+            if colored_action is None:
+                colored_action = self._colorize(action.upper(), 'bold')
             self._write(
                 f"\n{colored_action} {resource['resource_type']}: "
                 f"{resource['identifier']}\n"
@@ -181,39 +326,29 @@ class PlanReporter(BaseReporter, ReporterInterface):
 
     def _print_attribute_changes(self, resource: Dict) -> None:
         """Format attribute changes for a resource."""
-        lines = []
-        before = resource.get('before', {}) or {}
-        after = resource.get('after', {}) or {}
-        
-        # Get all changed attributes
-        all_attrs = set(before.keys()) | set(after.keys())
-        skip_attrs = {'id', 'tags_all'}  # Skip internal attributes
-        
-        # Define color mapping for symbols
-        symbol_colors = {
-            '+': 'green',   # create
-            '~': 'blue',    # update
-            '-': 'red',     # delete
-            '-/+': 'yellow' # replace
-        }
+        changes = _diff_attributes(
+            resource.get('before', {}) or {},
+            resource.get('after', {}) or {}
+        )
+        if not changes:
+            return
         
-        for attr in sorted(all_attrs - skip_attrs):
-            before_val = before.get(attr)
-            after_val = after.get(attr)
-            
-            if before_val != after_val:
-                if resource['action'] == 'create':
-                    symbol = self._colorize('+', symbol_colors['+'])
-                    lines.append(f"  {symbol} {attr} = {after_val}")
-                elif resource['action'] == 'delete':
-                    symbol = self._colorize('-', symbol_colors['-'])
-                    lines.append(f"  {symbol} {attr} = {before_val}")
-                elif resource['action'] == 'update':
-                    symbol = self._colorize('~', symbol_colors['~'])
-                    lines.append(f"  {symbol} {attr} = {before_val} -> {after_val}")
-                elif resource['action'] == 'replace':
-                    symbol = self._colorize('-/+', symbol_colors['-/+'])
-                    lines.append(f"  {symbol} {attr} = {before_val} -> {after_val}")
+        # Pick the line format once per resource rather than per attribute
+        action = resource['action']
+        if action == 'create':
+            symbol = _COLORED_SYMBOLS['+']
+            lines = [f"  {symbol} {c['attribute']} = {c['after']}" for c in changes]
+        elif action == 'delete':
+            symbol = _COLORED_SYMBOLS['-']
+            lines = [f"  {symbol} {c['attribute']} = {c['before']}" for c in changes]
+        elif action in ('update', 'replace'):
+            symbol = _COLORED_SYMBOLS['~' if action == 'update' else '-/+']
+            lines = [
+                f"  {symbol} {c['attribute']} = {c['before']} -> {c['after']}"
+                for c in changes
+            ]
+        else:
+            return
         
         self._write('\n'.join(lines))
 
@@ -224,7 +359,9 @@ class PlanReporter(BaseReporter, ReporterInterface):
             data: Plan analysis results
             **kwargs: Additional display options
         """
-        report = self.get_report(data, **kwargs)
+        from datetime import datetime
+
+        report = self.get_report(data)
         show_details = kwargs.get('show_details', False)
         show_changes = kwargs.get('show_changes', False)
 
@@ -236,11 +373,12 @@ class PlanReporter(BaseReporter, ReporterInterface):
         )
 
         # Prepare template data
+        breakdown = report['change_breakdown']
         template_data = {
             'total_resources': report['total_changes'],
-            'resources_to_add': report['change_breakdown']['create'],
-            'resources_to_change': report['change_breakdown']['update'],
-            'resources_to_destroy': report['change_breakdown']['delete'],
+            'resources_to_add': breakdown['create'],
+            'resources_to_change': breakdown['update'],
+            'resources_to_destroy': breakdown['delete'],
             'resources': processed_resources,
             'show_changes': show_changes,
             'show_details': show_details,
@@ -248,9 +386,8 @@ class PlanReporter(BaseReporter, ReporterInterface):
             'analysis': []  # Placeholder for future analysis results
         }
 
-        # Load and render template
-        template = self.env.get_template('plan_report.md')
-        output = template.render(**template_data)
+        # The environment keeps the compiled template between renders
+        output = self.env.get_template('plan_report.md').render(**template_data)
         
         # Write the output
         self._write(output)
@@ -262,18 +399,21 @@ class PlanReporter(BaseReporter, ReporterInterface):
             data: Plan analysis results
             **kwargs: Additional display options
         """
-        report = self.get_report(data, **kwargs)
+        from datetime import datetime
+
+        report = self.get_report(data)
         show_details = kwargs.get('show_details', False)
         show_changes = kwargs.get('show_changes', False)
 
-        # Process resources
-        processed_resources = self._process_resources(
+        # Process resources (the JSON encoder needs a concrete list)
+        processed_resources = list(self._process_resources(
             report.get('resources', []),
             show_changes=show_changes,
             show_details=show_details
-        )
+        ))
 
         # Prepare JSON output structure
+        breakdown = report['change_breakdown']
         json_output = {
             'metadata': {
                 'timestamp': datetime.now().isoformat(),
@@ -282,9 +422,9 @@ class PlanReporter(BaseReporter, ReporterInterface):
             },
             'summary': {
                 'total_resources': report['total_changes'],
-                'resources_to_add': report['change_breakdown']['create'],
-                'resources_to_change': report['change_breakdown']['update'],
-                'resources_to_destroy': report['change_breakdown']['delete']
+                'resources_to_add': breakdown['create'],
+                'resources_to_change': breakdown['update'],
+                'resources_to_destroy': breakdown['delete']
             },
             'resources': processed_resources
         }
@@ -293,5 +433,5 @@ class PlanReporter(BaseReporter, ReporterInterface):
         if 'analysis' in report:
             json_output['analysis'] = report['analysis']
 
-        # Write the JSON output with proper formatting
-        self._write(_json.dumps(json_output, indent=2)) 
\ No newline at end of file
+        # Write the JSON output, minified when requested
+        self._write(_dumps_json(json_output, compact=kwargs.get('compact', False))) 
\ No newline at end of file
@@ -1,14 +1,36 @@
 import importlib.util
-import glob
 import os
+from types import ModuleType
+from typing import Dict, Tuple
+
+# Executed plugin modules keyed by path, with the (mtime, size) they were
+# loaded at; the size catches edits within one coarse mtime tick
+_PLUGIN_CACHE: Dict[str, Tuple[Tuple[int, int], ModuleType]] = {}
 
 def load_plugins(context, plugin_dir="plugins"):
-    """Load and register plugins from the specified directory."""
+    """Load and register plugins from the specified directory.
+
+    Each plugin file is executed once per version on disk; later calls
+    reuse the cached module and only call its ``register`` hook again.
+    """
     if not os.path.isdir(plugin_dir):
         return
-    for path in glob.glob(os.path.join(plugin_dir, "*.py")):
-        spec = importlib.util.spec_from_file_location("plugin", path)
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
+    with os.scandir(plugin_dir) as entries:
+        plugin_files = [
+            (entry.path, entry.stat())
+            for entry in entries
+            if entry.name.endswith(".py") and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
+    for path, st in plugin_files:
+        version = (st.st_mtime_ns, st.st_size)
+        cached = _PLUGIN_CACHE.get(path)
+        if cached is not None and cached[0] == version:
+            mod = cached[1]
+        else:
+            spec = importlib.util.spec_from_file_location("plugin", path)
+            mod = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(mod)
+            _PLUGIN_CACHE[path] = (version, mod)
         if hasattr(mod, "register"):
-            mod.register(context) 
\ No newline at end of file
+            mod.register(context)
@@ -1,4 +1,5 @@
-from typing import TextIO
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, TextIO
 import sys
 import os
 from colorama import Fore, Style, init
@@ -26,6 +27,7 @@ class BaseReporter:
             output: Output stream to write to (defaults to stdout)
         """
         self.output = output
+        self._buffer: Optional[List[str]] = None
         # Initialize colorama with strip=True if colors should be disabled
         init(strip=not self._should_enable_color())
     
@@ -63,8 +65,25 @@ class BaseReporter:
         Args:
             title: Header title text
         """
-        self.output.write(f"\n{self._colorize(title, 'bold')}\n")
-        self.output.write("=" * 50 + "\n")
+        self._write(f"\n{self._colorize(title, 'bold')}\n")
+        self._write("=" * 50 + "\n")
+    
+    @contextmanager
+    def _buffered(self) -> Iterator[None]:
+        """Collect writes made inside the block and flush them in one call.
+        
+        Nested blocks share the outermost buffer.
+        """
+        if self._buffer is not None:
+            yield
+            return
+        self._buffer = []
+        try:
+            yield
+        finally:
+            buffer, self._buffer = self._buffer, None
+            if buffer:
+                self.output.write(''.join(buffer))
     
     def _write(self, text: str) -> None:
         """Write text to output stream.
@@ -72,4 +91,7 @@ class BaseReporter:
         Args:
             text: Text to write
         """
-        self.output.write(text) 
\ No newline at end of file
+        if self._buffer is not None:
+            self._buffer.append(text)
+        else:
+            self.output.write(text) 
\ No newline at end of file